@@ -13,8 +13,7 @@ def parse_document(content: str) -> Document:
 
 def generate_markup(data: Union[Dict[str, Any], Document]) -> str:
     """Generate MDML markup from dictionary or Document"""
-    # If it's a Document, convert to dict first
-    # ToDo: native conversion without going through dict?
+    # Documents are generated natively, without a dict round-trip
     if isinstance(data, Document):
         return MDMLGenerator.generate_markup_from_document(data)
     return MDMLGenerator.generate_markup_from_dict(data)
@@ -1,11 +1,26 @@
+import re
 from .patterns import Patterns
 
+# Single C-level scan for any of MDMLFormatter.SPECIAL_CHARS
+_SPECIAL_RE = re.compile(r'[ ,();|]').search
+
+# Every datatype that needs backticks in a list, fused into one anchored regex
+_LIST_QUOTE_RE = Patterns.LIST_NEEDS_QUOTING.match
+
+# Non-digit characters that can start one of those datatypes
+# (handle, variable, negative number, IPv6)
+_LIST_QUOTE_FIRST_CHARS = frozenset('@%-:abcdefABCDEF')
+
+
 class MDMLFormatter:
     """Centralized formatting rules for MDML generation"""
 
     INDENT_CHAR = '\t'
     SPECIAL_CHARS = {' ', ',', '(', ')', ';', '|'}
 
+    # Precomputed indentation strings for the usual nesting depths
+    _INDENT_CACHE = tuple('\t' * i for i in range(32))
+
     @staticmethod
     def needs_quoting(text: str) -> bool:
         """
@@ -17,7 +32,7 @@ class MDMLFormatter:
         Returns:
             True if text contains special characters requiring quotes
         """
-        return any(c in text for c in MDMLFormatter.SPECIAL_CHARS)
+        return _SPECIAL_RE(text) is not None
 
     @staticmethod
     def quote_value(text: str, context: str, has_metadata: bool = False, is_raw: bool = False, is_wiki_link: bool = False, is_raw_url: bool = False) -> str:
@@ -38,6 +53,27 @@ class MDMLFormatter:
             Inline: backticks always mandatory
             List: backticks always OPTIONAL (never added by generator)
         """
+        if context == 'inline':
+            return MDMLFormatter.quote_inline(text, has_metadata, is_wiki_link, is_raw_url)
+        elif context == 'list':
+            return MDMLFormatter.quote_list(text, has_metadata, is_wiki_link, is_raw_url)
+        else:
+            raise ValueError(f"Invalid context: {context}. Must be 'inline' or 'list'")
+
+    @staticmethod
+    def quote_inline(text: str, has_metadata: bool = False, is_wiki_link: bool = False, is_raw_url: bool = False) -> str:
+        """
+        Applies quoting rules for inline values (backticks mandatory)
+
+        Args:
+            text: The text value to quote
+            has_metadata: quote if one word
+            is_wiki_link: Avoid wrapping wikilinks in backticks
+            is_raw_url: Leave URLs unquoted
+
+        Returns:
+            Properly quoted text
+        """
         # Wiki links are never wrapped
         if is_wiki_link:
             return f"[[{text}]]"
@@ -48,24 +84,52 @@ class MDMLFormatter:
         if has_metadata:
             return f"`{text}`"
 
-        if context == 'inline':
-            # Inline values: backticks required UNLESS it's a known datatype
-            escaped = text.replace('`', '\\`')
-            return f"`{escaped}`"
+        # Inline values: backticks required UNLESS it's a known datatype
+        return MDMLFormatter._quote_inline(text)
 
-        elif context == 'list':
-            # List values:
-            #   backticks are OPTIONAL
-            #   Generator adds them in certain situations
-            #   Parser always accepts them
-            if MDMLFormatter.needs_quoting(text):
-                return f"`{text}`"
-            if MDMLFormatter.needs_quoting_in_list(text):
-                return f"`{text}`"
-            return text
+    @staticmethod
+    def quote_list(text: str, has_metadata: bool = False, is_wiki_link: bool = False, is_raw_url: bool = False) -> str:
+        """
+        Applies quoting rules for list values (backticks optional)
 
-        else:
-            raise ValueError(f"Invalid context: {context}. Must be 'inline' or 'list'")
+        Args:
+            text: The text value to quote
+            has_metadata: quote if one word
+            is_wiki_link: Avoid wrapping wikilinks in backticks
+            is_raw_url: Leave URLs unquoted
+
+        Returns:
+            Properly quoted text
+        """
+        # Wiki links are never wrapped
+        if is_wiki_link:
+            return f"[[{text}]]"
+
+        if is_raw_url:
+            return text.strip()
+
+        if has_metadata:
+            return f"`{text}`"
+
+        # List values:
+        #   backticks are OPTIONAL
+        #   Generator adds them in certain situations
+        #   Parser always accepts them
+        return MDMLFormatter._quote_list_plain(text)
+
+    @staticmethod
+    def _quote_inline(text: str) -> str:
+        """Inline quoting for a plain value (no metadata, wiki link or URL)"""
+        if '`' in text:
+            text = text.replace('`', '\\`')
+        return "`" + text + "`"
+
+    @staticmethod
+    def _quote_list_plain(text: str) -> str:
+        """List quoting for a plain value (no metadata, wiki link or URL)"""
+        if _SPECIAL_RE(text) is not None or MDMLFormatter.needs_quoting_in_list(text):
+            return f"`{text}`"
+        return text
 
     @staticmethod
     def make_indent(level: int) -> str:
@@ -78,6 +142,8 @@ class MDMLFormatter:
         Returns:
             Indentation string (tabs)
         """
+        if 0 <= level < 32:
+            return MDMLFormatter._INDENT_CACHE[level]
         return MDMLFormatter.INDENT_CHAR * level
 
     @staticmethod
@@ -92,47 +158,16 @@ class MDMLFormatter:
         - Datetimes: 2026-02-15 21:24
         - Handles: @something
         - Variables/emojis: %something%
+        - Scientific notation: 1.5e10, 2.3E-5
+        - IPv4 / IPv6 addresses
         """
-
-        # Handle/mention (@ at the start only)
-        if text.startswith('@') and ' ' not in text and '@' not in text[1:]:
-            return True
-
-        # Variable/emoji (wrapped in %)
-        if text.startswith('%') and text.endswith('%') and ' ' not in text:
-            return True
-
-        # Pure number (int or float, with optional thousand separators)
-        # Matches: 123, 123.45, 1,234, 1,234.56
-        if Patterns.NUMBER.match(text):
-            return True
-
-        if Patterns.NUMBER_FORMATTED.match(text):
-            return True
-
-        # Date (ISO format: YYYY-MM-DD)
-        if Patterns.DATE.match(text):
-            return True
-
-        # Time (HH:MM or HH:MM:SS)
-        if Patterns.TIME.match(text):
-            return True
-
-        # Datetime (YYYY-MM-DD HH:MM or YYYY-MM-DD HH:MM:SS)
-        if Patterns.DATETIME.match(text):
-            return True
-
-        # Scientific notation: 1.5e10, 2.3E-5, -1.5e10
-        # Matches: 1e10, 1.5e10, 1.5E-10, -1.5e10
-        if Patterns.SCIENTIFIC.match(text):
-            return True
-
-        # IPv4
-        if Patterns.IPv4.match(text):
-            return True
-
-        # IPv6 (supports full and compressed formats)
-        if Patterns.IPv6.match(text) or text == '::':
-            return True
-
-        return False
+        # Most list values are plain words: reject them on their first character
+        if not text:
+            return False
+        first = text[0]
+        if not first.isdigit() and first not in _LIST_QUOTE_FIRST_CHARS:
+            return False
+        # Identifiers (e.g. "deadbeef", "fade_in") can't be any of those datatypes
+        if text.isidentifier():
+            return False
+        return _LIST_QUOTE_RE(text) is not None
@@ -1,133 +1,173 @@
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any
 from .models import Field, FieldValue, Document
 from .formatter import MDMLFormatter
 
+# Read-only stand-in for FieldValue.sub_items when it is None
+_NO_SUB_ITEMS = MappingProxyType({})
+
 
 class MDMLGenerator:
     """Generates MDML format from Python data structures"""
 
     @staticmethod
-    def generate_value(value: FieldValue, indent: int = 0) -> List[str]:
+    def _format_array(array_values: Optional[List[str]]) -> str:
+        """Formats array values as { `val1` ; `val2` ; `val3` }"""
+        if not array_values:
+            return "{  }"
+        return "{ `" + "` ; `".join(map(str, array_values)) + "` }"
+
+    @staticmethod
+    def generate_value(value: FieldValue, indent: int = 0, out: Optional[List[str]] = None,
+                       name_prefix: str = '') -> List[str]:
         """
         Generates MDML text for a FieldValue
 
+        Args:
+            value: FieldValue to generate
+            indent: Indentation level
+            out: Line list to append to (a new one is created if omitted)
+            name_prefix: Emitted after "- " on the first line (e.g. "name: " for named sub-fields)
+
         Returns:
-            List of lines
+            List of lines (out, when given)
         """
-        lines = []
+        lines = [] if out is None else out
+        emit = lines.append
         tabs = MDMLFormatter.make_indent(indent)
 
+        text = value.value
+        details = value.details
+        date = value.date
+        time = value.time
+        is_raw_url = value.is_raw_url
+
         # Build main value line
         # Handle RAW format first (highest priority)
         if value.is_raw:
-            val = f"| {value.value} |"  # Always close pipes in generator (strict)
+            val = f"| {text} |"  # Always close pipes in generator (strict)
         elif value.is_array:
             # Array format: { `val1` ; `val2` ; `val3` }
-            array_str = ' ; '.join(f"`{v}`" for v in value.array_values)
-            val = f"{{ {array_str} }}"
+            val = MDMLGenerator._format_array(value.array_values)
         elif value.is_wiki_link:
-            if value.wiki_link and value.wiki_link != value.value:
-                val = f"[[{value.wiki_link}|{value.value}]]"
+            wiki_link = value.wiki_link
+            if wiki_link and wiki_link != text:
+                val = f"[[{wiki_link}|{text}]]"
             else:
-                val = f"[[{value.value}]]"
+                val = f"[[{text}]]"
         else:
             # Apply quoting rules for list context
-            has_metadata = bool(value.date or value.details)
+            has_metadata = bool(date or details)
             # Backticks are now OPTIONAL
-            val = MDMLFormatter.quote_value(
-                text=value.value,
-                context='list',
-                is_wiki_link=False,
-                has_metadata=has_metadata,
-                is_raw_url=value.is_raw_url
-            )
+            if has_metadata or is_raw_url:
+                val = MDMLFormatter.quote_list(
+                    text=text,
+                    has_metadata=has_metadata,
+                    is_raw_url=is_raw_url
+                )
+            else:
+                val = MDMLFormatter._quote_list_plain(text)
 
             # Apply strikethrough AFTER quoting
             if value.is_strikethrough:
                 val = f"~~{val}~~"
 
+        parts = [tabs, "- ", name_prefix, val]
+        append = parts.append
+
         # Add details (after value, before datetime)
-        if value.details:
-            val += f" ({value.details})"
+        if details:
+            append(f" ({details})")
 
         # Add datetime (always at the end)
-        if value.date:
-            if value.time:
-                val += f", `{value.date} {value.time}`"
+        if date:
+            if time:
+                append(f", `{date} {time}`")
             else:
-                val += f", `{value.date}`"
+                append(f", `{date}`")
 
-        lines.append(f"{tabs}- {val}")
+        emit(''.join(parts))
 
         # Add named sub-fields (with full support for dates/details)
-        for sub_name, sub_value in value.sub_items.items():
+        sub_items = value.sub_items or _NO_SUB_ITEMS
+        if sub_items:
             sub_tabs = MDMLFormatter.make_indent(indent + 1)
 
+        for sub_name, sub_value in sub_items.items():
+            sub_text = sub_value.value
+            sub_details = sub_value.details
+            sub_date = sub_value.date
+            sub_is_raw_url = sub_value.is_raw_url
+
             # Determine if sub-value has metadata
-            has_metadata = bool(sub_value.date or sub_value.details)
+            has_metadata = bool(sub_date or sub_details)
 
-            if value.is_raw_url:
-                sub_val = sub_value.value  # no backticks for URL
+            if is_raw_url:
+                sub_val = sub_text  # no backticks for URL
+            elif not has_metadata and not sub_is_raw_url:
+                sub_val = MDMLFormatter._quote_list_plain(sub_text)
             else:
                 # Quote sub-field value
-                sub_val = MDMLFormatter.quote_value(
-                    text=sub_value.value,
-                    context='list',
+                sub_val = MDMLFormatter.quote_list(
+                    text=sub_text,
                     has_metadata=has_metadata,
-                    is_raw=False,
-                    is_raw_url=sub_value.is_raw_url
+                    is_raw_url=sub_is_raw_url
                 )
 
+            parts = [sub_tabs, "- ", sub_name, ": ", sub_val]
+            append = parts.append
+
             # Add details for sub-field
-            if sub_value.details:
-                sub_val += f" ({sub_value.details})"
+            if sub_details:
+                append(f" ({sub_details})")
 
             # Add datetime for sub-field
-            if sub_value.date:
-                if sub_value.time:
-                    sub_val += f", `{sub_value.date} {sub_value.time}`"
+            if sub_date:
+                sub_time = sub_value.time
+                if sub_time:
+                    append(f", `{sub_date} {sub_time}`")
                 else:
-                    sub_val += f", `{sub_value.date}`"
+                    append(f", `{sub_date}`")
 
-            lines.append(f"{sub_tabs}- {sub_name}: {sub_val}")
+            emit(''.join(parts))
 
             # Recursively generate nested sub-items if present
-            if sub_value.sub_items:
-                for nested_name, nested_value in sub_value.sub_items.items():
-                    nested_lines = MDMLGenerator.generate_value(nested_value, indent + 2)
-                    # Convert to named sub-field format
-                    for i, line in enumerate(nested_lines):
-                        if i == 0:
-                            # First line: add field name
-                            lines.append(line.replace('- ', f'- {nested_name}: ', 1))
-                        else:
-                            lines.append(line)
-
-            if sub_value.list_sub_items:
-                for nested_item in sub_value.list_sub_items:
-                    lines.extend(MDMLGenerator.generate_value(nested_item, indent + 2))
+            nested_items = sub_value.sub_items
+            if nested_items:
+                for nested_name, nested_value in nested_items.items():
+                    # Named sub-field format: "- name: value"
+                    MDMLGenerator.generate_value(nested_value, indent + 2, lines, f"{nested_name}: ")
+
+            nested_list = sub_value.list_sub_items
+            if nested_list:
+                for nested_item in nested_list:
+                    MDMLGenerator.generate_value(nested_item, indent + 2, lines)
 
         # Add list sub-items (already recursive)
-        for sub_item in value.list_sub_items:
-            lines.extend(MDMLGenerator.generate_value(sub_item, indent + 1))
+        for sub_item in value.list_sub_items or ():
+            MDMLGenerator.generate_value(sub_item, indent + 1, lines)
 
         return lines
 
     @staticmethod
-    def generate_field(field: Field) -> List[str]:
+    def generate_field(field: Field, out: Optional[List[str]] = None) -> List[str]:
         """
         Generates MDML text for a Field
 
+        Args:
+            field: Field to generate
+            out: Line list to append to (a new one is created if omitted)
+
         Returns:
-            List of lines
+            List of lines (out, when given)
         """
-        lines = []
+        lines = [] if out is None else out
 
         if field.is_list:
             # List format
             lines.append(f"{field.name}:")
             for value in field.values:
-                lines.extend(MDMLGenerator.generate_value(value, 0))
+                MDMLGenerator.generate_value(value, 0, lines)
         else:
             # Inline format
             if field.values:
@@ -137,8 +177,7 @@ class MDMLGenerator:
                     val = f"| {value.value} |"
                 elif value.is_array:
                     # Array format: { `val1` ; `val2` ; `val3` }
-                    array_str = ' ; '.join(f"`{v}`" for v in value.array_values)
-                    val = f"{{ {array_str} }}"
+                    val = MDMLGenerator._format_array(value.array_values)
                 elif value.is_wiki_link:
                     if value.wiki_link and value.wiki_link != value.value:
                         val = f"[[{value.wiki_link}|{value.value}]]"
@@ -149,25 +188,29 @@ class MDMLGenerator:
                 else:
                     # Backticks by default for inline values
                     has_metadata = bool(value.date or value.details)
-                    val = MDMLFormatter.quote_value(
-                        text=value.value,
-                        context='inline',
-                        has_metadata=has_metadata,
-                        is_raw=False
-                    )
+                    if has_metadata:
+                        val = MDMLFormatter.quote_inline(
+                            text=value.value,
+                            has_metadata=has_metadata
+                        )
+                    else:
+                        val = MDMLFormatter._quote_inline(value.value)
+
+                parts = [field.name, ": ", val]
+                append = parts.append
 
                 # Add details
                 if value.details:
-                    val += f" ({value.details})"
+                    append(f" ({value.details})")
 
                 # Add datetime
                 if value.date:
                     if value.time:
-                        val += f", `{value.date} {value.time}`"
+                        append(f", `{value.date} {value.time}`")
                     else:
-                        val += f", `{value.date}`"
+                        append(f", `{value.date}`")
 
-                lines.append(f"{field.name}: {val}")
+                lines.append(''.join(parts))
 
         return lines
 
@@ -210,19 +253,19 @@ class MDMLGenerator:
                         details=val_data.get('details'),
                         is_strikethrough=val_data.get('is_strikethrough', False),
                         is_array=val_data.get('is_array', False),
-                        array_values=val_data.get('array_values', []),
+                        array_values=val_data.get('array_values'),
                         is_raw=val_data.get('is_raw', False),
                         is_wiki_link=val_data.get('is_wiki_link', False),
                         wiki_link=val_data.get('wiki_link'),
                         link_url=val_data.get('link_url')
                     )
                     if val_data.get('datetime'):
-                        parts = val_data['datetime'].split()
+                        parts = val_data['datetime'].split(None, 2)  # date, time (rest ignored)
                         fv.date = parts[0] if parts else None
                         fv.time = parts[1] if len(parts) > 1 else None
                     field.values.append(fv)
 
-                lines.extend(MDMLGenerator.generate_field(field))
+                MDMLGenerator.generate_field(field, lines)
                 lines.append('')
 
         return '\n'.join(lines)
@@ -251,7 +294,7 @@ class MDMLGenerator:
 
         # Fields - iterate directly on Document's fields
         for field_name, field in doc.fields.items():
-            lines.extend(MDMLGenerator.generate_field(field))
+            MDMLGenerator.generate_field(field, lines)
             lines.append('')
 
         return '\n'.join(lines)
@@ -1,5 +1,4 @@
 import json
-import yaml
 from typing import Dict, Any
 from .models import Document, Field, FieldValue
 
@@ -49,7 +48,7 @@ class MDMLImporter:
             details=val_data.get('details'),
             is_strikethrough=val_data.get('is_strikethrough', False),
             is_array=val_data.get('is_array', False),
-            array_values=val_data.get('array_values', []),
+            array_values=val_data.get('array_values'),
             is_raw=val_data.get('is_raw', False),
             is_raw_url=val_data.get('is_raw_url', False),
             is_wiki_link=val_data.get('is_wiki_link', False),
@@ -60,19 +59,23 @@ class MDMLImporter:
 
         # Import datetime
         if val_data.get('datetime'):
-            parts = val_data['datetime'].split()
+            parts = val_data['datetime'].split(None, 2)  # date, time (rest ignored)
             fv.date = parts[0] if parts else None
             fv.time = parts[1] if len(parts) > 1 else None
 
         # Import sub_items (named sub-fields) recursively
         if val_data.get('sub_items'):
-            for sub_name, sub_data in val_data['sub_items'].items():
-                fv.sub_items[sub_name] = MDMLImporter._import_field_value(sub_data)
+            fv.sub_items = {
+                sub_name: MDMLImporter._import_field_value(sub_data)
+                for sub_name, sub_data in val_data['sub_items'].items()
+            }
 
         # Import list_sub_items recursively
         if val_data.get('list_sub_items'):
-            for sub_data in val_data['list_sub_items']:
-                fv.list_sub_items.append(MDMLImporter._import_field_value(sub_data))
+            fv.list_sub_items = [
+                MDMLImporter._import_field_value(sub_data)
+                for sub_data in val_data['list_sub_items']
+            ]
 
         return fv
 
@@ -85,5 +88,6 @@ class MDMLImporter:
     @staticmethod
     def from_yaml(yaml_str: str) -> Document:
         """Create Document from YAML string"""
+        import yaml  # Optional dependency, only loaded when needed
         data = yaml.safe_load(yaml_str)
         return MDMLImporter.from_dict(data)
@@ -1,11 +1,10 @@
 import json
-import yaml
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldValue:
     """Represents a parsed field value with metadata"""
     value: str
@@ -15,14 +14,14 @@ class FieldValue:
     details: Optional[str] = None  # Content inside parentheses (detail)
     is_strikethrough: bool = False
     is_array: bool = False
-    array_values: List[str] = field(default_factory=list)
+    array_values: Optional[List[str]] = None  # None until the value is an array
     is_raw: bool = False
     is_wiki_link: bool = False
     is_raw_url: bool = False
     link_url: Optional[str] = None
     wiki_link: Optional[str] = None
-    sub_items: Dict[str, 'FieldValue'] = field(default_factory=dict)  # Named sub-fields
-    list_sub_items: List['FieldValue'] = field(default_factory=list)  # List sub-items
+    sub_items: Optional[Dict[str, 'FieldValue']] = None  # Named sub-fields (None if absent)
+    list_sub_items: Optional[List['FieldValue']] = None  # List sub-items (None if absent)
     parse_error: Optional[str] = None  # Non-blocking parse error
 
 
@@ -41,6 +40,13 @@ class FieldValue:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for export"""
+        link_url = self.link_url
+        wiki_link = self.wiki_link
+        details = self.details
+        sub_items = self.sub_items
+        list_sub_items = self.list_sub_items
+        parse_error = self.parse_error
+
         result = {
             'value': self.value,
             'datetime': self.datetime_str,
@@ -48,35 +54,35 @@ class FieldValue:
         }
         if self.is_array:
             result['is_array'] = True
-            result['array_values'] = self.array_values
+            result['array_values'] = self.array_values or []
         if self.is_raw:
             result['is_raw'] = True
         if self.is_wiki_link:
             result['is_wiki_link'] = True
         if self.is_raw_url:
             result['is_raw_url'] = True
-        if self.link_url:
-            result['link_url'] = self.link_url
-        if self.wiki_link:
-            result['wiki_link'] = self.wiki_link
-        if self.details:
-            result['details'] = self.details
-        if self.sub_items:
-            result['sub_items'] = {k: v.to_dict() for k, v in self.sub_items.items()}
-        if self.list_sub_items:
-            result['list_sub_items'] = [v.to_dict() for v in self.list_sub_items]
-        if self.parse_error:
-            result['parse_error'] = self.parse_error
+        if link_url:
+            result['link_url'] = link_url
+        if wiki_link:
+            result['wiki_link'] = wiki_link
+        if details:
+            result['details'] = details
+        if sub_items:
+            result['sub_items'] = {k: v.to_dict() for k, v in sub_items.items()}
+        if list_sub_items:
+            result['list_sub_items'] = [v.to_dict() for v in list_sub_items]
+        if parse_error:
+            result['parse_error'] = parse_error
         return result
 
-@dataclass
+@dataclass(slots=True)
 class FieldBlock:
     """Represents a raw field block for linear parsing"""
     name: str
     raw_content: str  # Complete text of the field block
     start_line: int   # Line number where field starts (1-indexed)
 
-@dataclass
+@dataclass(slots=True)
 class Field:
     """Represents a parsed field (inline or list)"""
     name: str
@@ -109,7 +115,7 @@ class Field:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """Represents a parsed MDML document"""
     fields: Dict[str, Field] = field(default_factory=dict)
@@ -161,4 +167,5 @@ class Document:
 
     def to_yaml(self) -> str:
         """Export as YAML"""
+        import yaml  # Optional dependency, only loaded when needed
         return yaml.dump(self.to_dict(), default_flow_style=False, allow_unicode=True)
@@ -1,8 +1,9 @@
-from typing import Optional, List, Dict, Tuple
+import sys
+from functools import lru_cache
+from typing import Optional, List, Dict, Tuple, Any
 from .models import FieldValue, Field, Document, FieldBlock
 from .patterns import Patterns
 from .utils import (
-    count_leading_tabs,
     clean_markdown,
     detect_strikethrough,
     extract_details,
@@ -13,6 +14,10 @@ from .utils import (
     is_url
 )
 
+# Bound regex methods for the per-line loops below
+_sub_field_match = Patterns.SUB_FIELD.match
+_list_item_match = Patterns.LIST_ITEM.match
+
 
 class MDMLParser:
     """MDML Parser - Resilient parsing with error recovery"""
@@ -28,51 +33,30 @@ class MDMLParser:
         Returns:
             tuple: (list of FieldBlock objects, frontmatter dict)
         """
-        # Parse frontmatter first
-        frontmatter, body = MDMLParser.parse_frontmatter(content)
-
-        # Calculate line offset (frontmatter lines + separator)
-        frontmatter_lines = 0
-        if frontmatter:
-            match = Patterns.FRONTMATTER.match(content)
-            if match:
-                frontmatter_lines = content[:match.end()].count('\n')
+        # Parse frontmatter first (and its line offset, separators included)
+        frontmatter, body, frontmatter_lines = MDMLParser._split_frontmatter(content)
 
         blocks = []
-        lines = body.split('\n')
-        current_block = None
-        current_block_lines = []
+        matches = list(Patterns.FIELD_HEADER.finditer(body))
+        line_num = 1 + frontmatter_lines
+        prev_start = 0
+
+        for idx, field_match in enumerate(matches):
+            start = field_match.start()
 
-        for line_idx, line in enumerate(lines, start=1):
             # Adjust line number for frontmatter offset
-            absolute_line_num = line_idx + frontmatter_lines
-
-            # Check if line starts a new field
-            field_match = Patterns.FIELD_START.match(line)
-
-            if field_match:
-                # Save previous block if exists
-                if current_block is not None:
-                    current_block.raw_content = '\n'.join(current_block_lines)
-                    blocks.append(current_block)
-
-                # Start new block
-                field_name = field_match.group(1).strip()
-                current_block = FieldBlock(
-                    name=field_name,
-                    raw_content='',  # Will be filled when block ends
-                    start_line=absolute_line_num
-                )
-                current_block_lines = [line]
+            line_num += body.count('\n', prev_start, start)
+            prev_start = start
 
-            elif current_block is not None:
-                # Continue current block
-                current_block_lines.append(line)
+            # Block runs until the newline before the next field (or end of body)
+            end = matches[idx + 1].start() - 1 if idx + 1 < len(matches) else len(body)
 
-        # Don't forget last block
-        if current_block is not None:
-            current_block.raw_content = '\n'.join(current_block_lines)
-            blocks.append(current_block)
+            field_name = sys.intern(field_match.group(1).strip())
+            blocks.append(FieldBlock(
+                name=field_name,
+                raw_content=body[start:end],
+                start_line=line_num
+            ))
 
         return blocks, frontmatter
 
@@ -89,125 +73,140 @@ class MDMLParser:
         5. Detect explicit datatypes (RAW pipes, array, wiki_link)
         6. Fallback to RAW or regular value
         """
-        original = raw_value
-        text = raw_value
-        link_url = None
-
         try:
-            text, date_str, time_str, dt_obj = extract_datetime(text)
+            fields = _parse_value_cached(raw_value)
+        except Exception as e:
+            error_msg = f"Parse error at line {line_num}: {str(e)}" if line_num else str(e)
+            return FieldValue(
+                value=raw_value.strip(),
+                parse_error=error_msg
+            )
 
-            text, details = extract_details(text)
+        value = FieldValue(**fields)
+        if value.array_values is not None:
+            value.array_values = list(value.array_values)  # Never share the cached list
+        return value
 
-            is_strikethrough = detect_strikethrough(text)
+    @staticmethod
+    def _parse_value_fields(raw_value: str) -> Dict[str, Any]:
+        """
+        Parses a single value into FieldValue constructor arguments
 
-            text_has_backticks = text.strip().startswith('`') and text.strip().endswith('`')
+        Pure function of raw_value, cached by _parse_value_cached.
+        Raises on unexpected errors (handled by parse_value).
+        """
+        text = raw_value
+        link_url = None
 
-            text, link_url = clean_markdown(text)
+        text, date_str, time_str, dt_obj = extract_datetime(text)
 
-            if is_url(text):
-                return FieldValue(
-                    value=text.strip(),
-                    date=date_str,
-                    time=time_str,
-                    datetime_obj=dt_obj,
-                    details=details,
-                    is_strikethrough=is_strikethrough,
-                    link_url=link_url,
-                    is_raw_url=True
-                )
+        text, details = extract_details(text)
 
-            # Detect explicit datatypes
-
-            # 1: RAW text with pipes (highest priority)
-            raw_text, is_raw = extract_raw_text(text)
-            if is_raw:
-                return FieldValue(
-                    value=raw_text,
-                    is_raw=True,
-                    date=date_str,
-                    time=time_str,
-                    datetime_obj=dt_obj,
-                    details=details,
-                    link_url=link_url,
-                    parse_error=None
-                )
+        is_strikethrough = detect_strikethrough(text)
 
-            # 2: Array format
-            array_values, text_without_array = extract_array(text)
-            if array_values is not None:
-                return FieldValue(
-                    value="",
-                    is_array=True,
-                    array_values=array_values,
-                    date=date_str,
-                    time=time_str,
-                    datetime_obj=dt_obj,
-                    details=details,
-                    link_url=link_url,
-                    parse_error=None
-                )
+        stripped = text.strip()
+        text_has_backticks = stripped.startswith('`') and stripped.endswith('`')
 
-            # 3: Wiki link format
-            wiki_link, display, is_wiki = extract_wiki_link(text)
-            if is_wiki:
-                return FieldValue(
-                    value=display,
-                    is_wiki_link=True,
-                    wiki_link=wiki_link,
-                    date=date_str,
-                    time=time_str,
-                    datetime_obj=dt_obj,
-                    details=details,
-                    link_url=link_url,
-                    parse_error=None
-                )
+        # Returns stripped text
+        text, link_url = clean_markdown(text)
+
+        if is_url(text):
+            return dict(
+                value=text,
+                date=date_str,
+                time=time_str,
+                datetime_obj=dt_obj,
+                details=details,
+                is_strikethrough=is_strikethrough,
+                link_url=link_url,
+                is_raw_url=True
+            )
 
-            # Detect intentional formatting
-            clean_text = text
+        # Detect explicit datatypes
 
-            # Detect intentional formatting (backticks were checked earlier)
-            has_intentional_formatting = (
-                    is_strikethrough or  # ~~...~~
-                    link_url or  # [...](...)
-                    text_has_backticks  # `...` (detected before cleaning)
+        # 1: RAW text with pipes (highest priority)
+        raw_text, is_raw = extract_raw_text(text)
+        if is_raw:
+            return dict(
+                value=raw_text,
+                is_raw=True,
+                date=date_str,
+                time=time_str,
+                datetime_obj=dt_obj,
+                details=details,
+                link_url=link_url,
+                parse_error=None
             )
 
-            # Fallback to RAW (only for multi-word text without formatting)
-            should_fallback_raw = (
-                    not has_intentional_formatting and
-                    ' ' in clean_text
+        # 2: Array format
+        array_values, text_without_array = extract_array(text)
+        if array_values is not None:
+            return dict(
+                value="",
+                is_array=True,
+                array_values=array_values,
+                date=date_str,
+                time=time_str,
+                datetime_obj=dt_obj,
+                details=details,
+                link_url=link_url,
+                parse_error=None
             )
 
-            if should_fallback_raw:
-                return FieldValue(
-                    value=clean_text,
-                    is_raw=True,
-                    date=date_str,
-                    time=time_str,
-                    datetime_obj=dt_obj,
-                    details=details,
-                    link_url=link_url,
-                    parse_error=None
-                )
+        # 3: Wiki link format
+        wiki_link, display, is_wiki = extract_wiki_link(text)
+        if is_wiki:
+            return dict(
+                value=display,
+                is_wiki_link=True,
+                wiki_link=wiki_link,
+                date=date_str,
+                time=time_str,
+                datetime_obj=dt_obj,
+                details=details,
+                link_url=link_url,
+                parse_error=None
+            )
 
-            # Regular value (single word or with intentional formatting)
-            return FieldValue(
+        # Detect intentional formatting
+        clean_text = text
+
+        # Detect intentional formatting (backticks were checked earlier)
+        has_intentional_formatting = (
+                is_strikethrough or  # ~~...~~
+                link_url or  # [...](...)
+                text_has_backticks  # `...` (detected before cleaning)
+        )
+
+        # Fallback to RAW (only for multi-word text without formatting)
+        should_fallback_raw = (
+                not has_intentional_formatting and
+                ' ' in clean_text
+        )
+
+        if should_fallback_raw:
+            return dict(
                 value=clean_text,
+                is_raw=True,
                 date=date_str,
                 time=time_str,
                 datetime_obj=dt_obj,
                 details=details,
-                is_strikethrough=is_strikethrough,
                 link_url=link_url,
                 parse_error=None
             )
 
-        except Exception as e:
-            error_msg = f"Parse error at line {line_num}: {str(e)}" if line_num else str(e)
-            return FieldValue(
-                value=original.strip(),
-                parse_error=error_msg
-            )
+        # Regular value (single word or with intentional formatting)
+        return dict(
+            value=clean_text,
+            date=date_str,
+            time=time_str,
+            datetime_obj=dt_obj,
+            details=details,
+            is_strikethrough=is_strikethrough,
+            link_url=link_url,
+            parse_error=None
+        )
 
 
     @staticmethod
@@ -223,77 +222,98 @@ class MDMLParser:
         Returns:
             tuple: (sub_fields_dict, sub_list_items, errors)
         """
-        sub_fields = {}
-        sub_list = []
-        errors = []
+        parent = FieldValue(value='')
+        next_sibling = MDMLParser._next_siblings(lines)
+        MDMLParser._parse_sub_item_range(lines, next_sibling, 0, len(lines), base_indent, parent)
+        return parent.sub_items or {}, parent.list_sub_items or [], []
 
-        i = 0
-        while i < len(lines):
-            indent, content = lines[i]
+    @staticmethod
+    def _next_siblings(lines: List[Tuple[int, str]]) -> List[int]:
+        """
+        For each line, finds the index of the next line that is not nested under it
 
-            # Must be exactly one tab deeper than base
-            if indent != base_indent + 1:
-                i += 1
-                continue
+        Args:
+            lines: List of (indent_level, content) tuples
 
-            # Check if it's a named sub-field: "- field: value"
-            sub_field_match = Patterns.SUB_FIELD.match(content)
-            if sub_field_match:
-                field_name = sub_field_match.group(1).strip()
-                field_value = sub_field_match.group(2)
-
-                # Check if this sub-field has its own nested items
-                nested_lines = []
-                j = i + 1
-                while j < len(lines) and lines[j][0] > indent:
-                    nested_lines.append(lines[j])
-                    j += 1
-
-                parsed_value = MDMLParser.parse_value(field_value)
-
-                # Parse nested items if any
-                if nested_lines:
-                    nested_fields, nested_list, nested_errors = MDMLParser.parse_sub_items(
-                        nested_lines, indent
-                    )
-                    parsed_value.sub_items = nested_fields
-                    parsed_value.list_sub_items = nested_list
-                    errors.extend(nested_errors)
-
-                sub_fields[field_name] = parsed_value
-                i = j
-                continue
+        Returns:
+            List where item i is the first j > i with indent[j] <= indent[i] (len(lines) if none)
+        """
+        count = len(lines)
+        next_sibling = [count] * count
+        stack = []  # Indices of lines with non-decreasing indents, nearest last
 
-            # Check if it's a list item: "- value"
-            list_match = Patterns.LIST_ITEM.match(content)
-            if list_match:
-                item_value = list_match.group(1)
-
-                # Check for nested items
-                nested_lines = []
-                j = i + 1
-                while j < len(lines) and lines[j][0] > indent:
-                    nested_lines.append(lines[j])
-                    j += 1
-
-                parsed_value = MDMLParser.parse_value(item_value)
-
-                # Parse nested items
-                if nested_lines:
-                    nested_fields, nested_list, nested_errors = MDMLParser.parse_sub_items(
-                        nested_lines, indent
-                    )
-                    parsed_value.sub_items = nested_fields
-                    parsed_value.list_sub_items = nested_list
-                    errors.extend(nested_errors)
-
-                sub_list.append(parsed_value)
-                i = j
-                continue
+        for i in range(count - 1, -1, -1):
+            indent = lines[i][0]
+            while stack and lines[stack[-1]][0] > indent:
+                stack.pop()
+            if stack:
+                next_sibling[i] = stack[-1]
+            stack.append(i)
+
+        return next_sibling
+
+    @staticmethod
+    def _parse_sub_item_range(lines: List[Tuple[int, str]], next_sibling: List[int], start: int, end: int,
+                              base_indent: int, parent: FieldValue) -> None:
+        """
+        Parses sub-items of lines[start:end] iteratively into parent
 
-            i += 1
+        sub_items / list_sub_items are only created when an item is found.
 
-        return sub_fields, sub_list, errors
+        Args:
+            lines: List of (indent_level, content) tuples
+            next_sibling: Result of _next_siblings(lines)
+            start: First line of the range
+            end: End of the range (exclusive)
+            base_indent: Base indentation level to compare against
+            parent: FieldValue receiving the parsed sub-items
+        """
+        parse_value = MDMLParser.parse_value
+
+        # Pending ranges: (start, end, base_indent, parent)
+        pending = [(start, end, base_indent, parent)]
+
+        while pending:
+            i, end, base_indent, parent = pending.pop()
+
+            while i < end:
+                indent, content = lines[i]
+
+                # Must be exactly one tab deeper than base, and an item ("- ...")
+                if indent != base_indent + 1 or content[:1] != '-':
+                    i += 1
+                    continue
+
+                # Check if it's a named sub-field: "- field: value"
+                field_name = None
+                sub_field_match = _sub_field_match(content)
+                if sub_field_match:
+                    field_name = sys.intern(sub_field_match.group(1).strip())
+                    item_value = sub_field_match.group(2)
+                else:
+                    # Check if it's a list item: "- value"
+                    list_match = _list_item_match(content)
+                    if not list_match:
+                        i += 1
+                        continue
+                    item_value = list_match.group(1)
+
+                parsed_value = parse_value(item_value)
+
+                # Nested items (if any) run until the next line at this indent or less
+                j = next_sibling[i]
+                if j > i + 1:
+                    pending.append((i + 1, j, indent, parsed_value))
+
+                if field_name is not None:
+                    if parent.sub_items is None:
+                        parent.sub_items = {}
+                    parent.sub_items[field_name] = parsed_value
+                else:
+                    if parent.list_sub_items is None:
+                        parent.list_sub_items = []
+                    parent.list_sub_items.append(parsed_value)
+                i = j
 
     @staticmethod
     def parse_field_block(block: FieldBlock) -> Optional[Field]:
@@ -356,18 +376,18 @@ class MDMLParser:
         if inline_value and is_list_format:
             indexed_lines.append((0, f"- {inline_value}"))
 
-        # Add rest of lines
-        for line_idx, line in enumerate(lines[1:], start=1):  # Skip field name line
-            if not line.strip():
+        # Add rest of lines (indent = number of leading tabs)
+        for line in lines[1:]:  # Skip field name line
+            if not line or line.isspace():
                 continue
-            indent = count_leading_tabs(line)
             content_stripped = line.lstrip('\t')
-            indexed_lines.append((indent, content_stripped))
+            indexed_lines.append((len(line) - len(content_stripped), content_stripped))
 
         if not indexed_lines:
             return None  # Empty field
 
         # Parse top-level items (indent = 0)
+        next_sibling = MDMLParser._next_siblings(indexed_lines)
         values = []
         i = 0
         while i < len(indexed_lines):
@@ -378,7 +398,7 @@ class MDMLParser:
                 continue
 
             # Must be a list item
-            list_match = Patterns.LIST_ITEM.match(item_content)
+            list_match = _list_item_match(item_content)
             if not list_match:
                 errors.append(f"Invalid list item format at line {block.start_line + i + 1}: {item_content}")
                 i += 1
@@ -386,23 +406,16 @@ class MDMLParser:
 
             item_value = list_match.group(1)
 
-            # Collect sub-items (indent > 0)
-            sub_lines = []
-            j = i + 1
-            while j < len(indexed_lines) and indexed_lines[j][0] > 0:
-                sub_lines.append(indexed_lines[j])
-                j += 1
+            # Sub-items (indent > 0) run until the next top-level line
+            j = next_sibling[i]
 
             # Parse main value
             try:
                 parsed_value = MDMLParser.parse_value(item_value, block.start_line + i + 1)
 
                 # Parse sub-items
-                if sub_lines:
-                    sub_fields, sub_list, sub_errors = MDMLParser.parse_sub_items(sub_lines, 0)
-                    parsed_value.sub_items = sub_fields
-                    parsed_value.list_sub_items = sub_list
-                    errors.extend(sub_errors)
+                if j > i + 1:
+                    MDMLParser._parse_sub_item_range(indexed_lines, next_sibling, i + 1, j, 0, parsed_value)
 
                 values.append(parsed_value)
             except Exception as e:
@@ -430,12 +443,27 @@ class MDMLParser:
         Returns:
             tuple: (frontmatter_dict, content_without_frontmatter)
         """
+        frontmatter, content_without, _ = MDMLParser._split_frontmatter(content)
+        return frontmatter, content_without
+
+    @staticmethod
+    def _split_frontmatter(content: str) -> Tuple[Dict[str, str], str, int]:
+        """
+        Parses YAML frontmatter with a single regex match
+
+        Returns:
+            tuple: (frontmatter_dict, content_without_frontmatter, frontmatter_line_count)
+        """
+        if not content.startswith('---'):
+            return {}, content, 0
+
         match = Patterns.FRONTMATTER.match(content)
         if not match:
-            return {}, content
+            return {}, content, 0
 
         yaml_text = match.group(1)
         content_without = content[match.end():]
+        line_count = content.count('\n', 0, match.end())
 
         # Simple YAML parser
         frontmatter = {}
@@ -445,7 +473,7 @@ class MDMLParser:
                 key, value = line.split(':', 1)
                 frontmatter[key.strip()] = value.strip()
 
-        return frontmatter, content_without
+        return frontmatter, content_without, line_count
 
     @staticmethod
     def parse_document(content: str) -> Document:
@@ -479,3 +507,7 @@ class MDMLParser:
             doc.parse_errors.append(f"Critical parsing error: {str(e)}")
 
         return doc
+
+
+# Values repeat a lot across documents (tags, statuses, dates): cache their parsing
+_parse_value_cached = lru_cache(maxsize=4096)(MDMLParser._parse_value_fields)
@@ -10,12 +10,12 @@ class Patterns:
     # Field detection
     FIELD_START = re.compile(r'^([a-z][a-z0-9_. ]*):\s*(.*)$', re.MULTILINE)
 
+    # Field header only, for scanning a whole body (\s* above would run across lines)
+    FIELD_HEADER = re.compile(r'^([a-z][a-z0-9_. ]*):', re.MULTILINE)
+
     # List item with TAB indentation
     LIST_ITEM = re.compile(r'^-\s+(.+)$')
 
-    # Sub-item detection (starts with TAB)
-    TAB_INDENT = re.compile(r'^\t+')
-
     # Date/time extraction (at end of value, after comma)
     DATETIME_SUFFIX = re.compile(r',\s*`?(\d{4}-\d{2}-\d{2})(?:\s+(\d{2}:\d{2}))?`?\s*$')
     
@@ -42,6 +42,12 @@ class Patterns:
     # Wiki link format: [[link_name]]
     WIKI_LINK = re.compile(r'\[\[([^\|\]]+)(?:\|([^\]]+))?\]\]')
 
+    # Handle/mention: @something (@ at the start only, no spaces)
+    HANDLE = re.compile(r'\A@[^ @]*\Z')
+
+    # Variable/emoji: %something% (no spaces)
+    VARIABLE = re.compile(r'\A%(?:[^ ]*%)?\Z')
+
     NUMBER_FORMATTED = re.compile(r'^\d{1,3}(,\d{3})*(\.\d+)?$')
 
     NUMBER = re.compile(r'^-?\d+(\.\d+)?$')
@@ -61,3 +67,10 @@ class Patterns:
     #          ::1
     #          fe80::
     IPv6 = re.compile(r'^([0-9a-fA-F]{0,4}:){2,7}[0-9a-fA-F]{0,4}$')
+
+    # Any list value that needs backticks (see MDMLFormatter.needs_quoting_in_list)
+    # All alternatives are anchored, so a single match() tests every datatype
+    LIST_NEEDS_QUOTING = re.compile('|'.join(
+        f'(?:{p.pattern})'
+        for p in (HANDLE, VARIABLE, NUMBER, NUMBER_FORMATTED, DATE, TIME, DATETIME, SCIENTIFIC, IPv4, IPv6)
+    ))
@@ -1,15 +1,32 @@
+import re
 from datetime import datetime
 from typing import Tuple, Optional, List
 from .patterns import Patterns
-from re import compile, IGNORECASE
+
+# Bound regex methods for the per-value helpers below
+_strikethrough_search = Patterns.STRIKETHROUGH.search
+_strikethrough_sub = Patterns.STRIKETHROUGH.sub
+_code_block_sub = Patterns.CODE_BLOCK.sub
+_link_sub = Patterns.LINK.sub
+_datetime_suffix_search = Patterns.DATETIME_SUFFIX.search
+_datetime_only_search = Patterns.DATETIME_ONLY.search
+_array_search = Patterns.ARRAY.search
+_raw_text_search = Patterns.RAW_TEXT.search
+_wiki_link_search = Patterns.WIKI_LINK.search
+
+# Any markdown that clean_markdown removes: link "](", strikethrough "~~" or code "`"
+_markdown_search = re.compile(r'\]\(|~~|`').search
+
+_URL_PATTERN = re.compile(
+    r'^(https?|ftp|ftps|ws|wss|file)://'  # Protocol
+    r'[^\s]+$',  # Rest of URL (no whitespace)
+    re.IGNORECASE
+)
 
 
 def count_leading_tabs(line: str) -> int:
     """Count leading tabs in a line"""
-    match = Patterns.TAB_INDENT.match(line)
-    if match:
-        return len(match.group(0))
-    return 0
+    return len(line) - len(line.lstrip('\t'))
 
 
 def detect_strikethrough(text: str) -> bool:
@@ -22,7 +39,9 @@ def detect_strikethrough(text: str) -> bool:
     Returns:
         True if ~~...~~ pattern is found
     """
-    return bool(Patterns.STRIKETHROUGH.search(text))
+    if '~~' not in text:
+        return False
+    return bool(_strikethrough_search(text))
 
 
 def clean_markdown(text: str) -> Tuple[str, Optional[str]]:
@@ -33,23 +52,73 @@ def clean_markdown(text: str) -> Tuple[str, Optional[str]]:
     Returns:
         tuple: (cleaned_text, link_url)
     """
+    # Plain text (most values): one scan instead of three
+    if _markdown_search(text) is None:
+        return text.strip(), None
+
     link_url = None
 
-    # Extract link
-    link_match = Patterns.LINK.search(text)
-    if link_match:
-        text = Patterns.LINK.sub(r'\1', text)  # Replace [text](url) with text
-        link_url = link_match.group(2)
+    # Extract link: replace [text](url) with text, keep the first url
+    if '](' in text:
+        link_urls = []
+
+        def _link_text(match):
+            link_urls.append(match.group(2))
+            return match.group(1)
+
+        text = _link_sub(_link_text, text)
+        if link_urls:
+            link_url = link_urls[0]
 
     # Remove strikethrough
-    text = Patterns.STRIKETHROUGH.sub(r'\1', text)
+    if '~~' in text:
+        text = _strikethrough_sub(r'\1', text)
 
     # Remove code blocks
-    text = Patterns.CODE_BLOCK.sub(r'\1', text)
+    if '`' in text:
+        text = _code_block_sub(r'\1', text)
 
     return text.strip(), link_url
 
 
+def _find_details_open(text: str) -> int:
+    """
+    Walks backwards from the final ')' to its matching '(' (skipping markdown links)
+
+    Returns:
+        Position of the opening paren, or -1 if unbalanced or not found
+    """
+    # Walk backwards to find matching opening paren,
+    # jumping from paren to paren with rfind instead of stepping through every char
+    paren_count = 1
+    last = len(text) - 1  # Position of the final )
+    open_pos = text.rfind('(', 0, last)
+    close_pos = text.rfind(')', 0, last)
+
+    while open_pos >= 0 or close_pos >= 0:
+        if close_pos > open_pos:
+            paren_count += 1
+            close_pos = text.rfind(')', 0, close_pos)
+            continue
+
+        paren_count -= 1
+
+        # Found a matching opening paren
+        if paren_count == 0:
+            # Check if this is part of a markdown link ](...)
+            if open_pos > 0 and text[open_pos - 1] == ']':
+                # This (...) is a markdown link, continue searching for outer pair
+                paren_count = 1  # Reset and keep searching
+            else:
+                # This is our detail block!
+                return open_pos
+
+        open_pos = text.rfind('(', 0, open_pos)
+
+    # Unbalanced parens or not found
+    return -1
+
+
 def extract_details(text: str) -> Tuple[str, Optional[str]]:
     """
     Extracts details from the LAST parentheses pair at end of text
@@ -64,33 +133,16 @@ def extract_details(text: str) -> Tuple[str, Optional[str]]:
     if not text.endswith(')'):
         return text, None
 
-    # Walk backwards to find matching opening paren
-    paren_count = 1
-    pos = len(text) - 2  # Start before last )
-
-    while pos >= 0:
-        if text[pos] == ')':
-            paren_count += 1
-        elif text[pos] == '(':
-            paren_count -= 1
-
-            # Found a matching opening paren
-            if paren_count == 0:
-                # Check if this is part of a markdown link ](...)
-                if pos > 0 and text[pos - 1] == ']':
-                    # This (...) is a markdown link, continue searching for outer pair
-                    paren_count = 1  # Reset and keep searching
-                else:
-                    # This is our detail block!
-                    break
-
-        pos -= 1
-
-    if paren_count != 0 or pos < 0:
-        # Unbalanced parens or not found
+    # Fast path: the last "(" closes at the final ")" and is not a markdown link ](...)
+    open_pos = text.rfind('(')
+    if open_pos < 0:
         return text, None
-
-    open_pos = pos
+    if text.find(')', open_pos) != len(text) - 1 or (open_pos > 0 and text[open_pos - 1] == ']'):
+        # Nested parentheses or markdown links: walk backwards
+        open_pos = _find_details_open(text)
+        if open_pos < 0:
+            # Unbalanced parens or not found
+            return text, None
 
     # Extract detail content
     details = text[open_pos + 1:-1].strip()
@@ -106,10 +158,14 @@ def extract_datetime(text: str) -> Tuple[str, Optional[str], Optional[str], Opti
     Returns:
         tuple: (text_without_date, date_str, time_str, datetime_obj)
     """
-    match = Patterns.DATETIME_SUFFIX.search(text)
+    # Both datetime patterns need a YYYY-MM-DD date
+    if '-' not in text:
+        return text, None, None, None
+
+    match = _datetime_suffix_search(text)
     if not match:
         # check if text is only a datetime object
-        match = Patterns.DATETIME_ONLY.search(text)  # ToDo: Should we postpone this check until we get other field data?
+        match = _datetime_only_search(text)  # ToDo: Should we postpone this check until we get other field data?
         if not match:
             return text, None, None, None
         else:
@@ -122,13 +178,14 @@ def extract_datetime(text: str) -> Tuple[str, Optional[str], Optional[str], Opti
         time_str = match.group(2)  # May be None
         text_clean = text[:match.start()].strip()
 
-    # Parse datetime
+    # Parse datetime (fixed-width fields already validated by the regex)
     dt_obj = None
     try:
+        year, month, day = int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])
         if time_str:
-            dt_obj = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+            dt_obj = datetime(year, month, day, int(time_str[0:2]), int(time_str[3:5]))
         else:
-            dt_obj = datetime.strptime(date_str, "%Y-%m-%d")
+            dt_obj = datetime(year, month, day)
     except ValueError:
         pass  # Invalid datetime format - non-blocking
 
@@ -142,7 +199,10 @@ def extract_array(text: str) -> Tuple[Optional[List[str]], str]:
     Returns:
         tuple: (array_values, text_without_array)
     """
-    match = Patterns.ARRAY.search(text)
+    if '{' not in text:
+        return None, text
+
+    match = _array_search(text)
     if not match:
         return None, text
 
@@ -177,7 +237,10 @@ def extract_raw_text(text: str) -> Tuple[Optional[str], bool]:
     Returns:
         tuple: (raw_text, is_raw)
     """
-    match = Patterns.RAW_TEXT.search(text)
+    if '|' not in text:
+        return None, False
+
+    match = _raw_text_search(text)
     if not match:
         return None, False
 
@@ -193,7 +256,10 @@ def extract_wiki_link(text: str) -> Tuple[Optional[str], Optional[str], bool]:
     Returns:
         tuple: (wiki_link, display_text, is_wiki_link)
     """
-    match = Patterns.WIKI_LINK.search(text)
+    if '[[' not in text:
+        return None, None, False
+
+    match = _wiki_link_search(text)
     if not match:
         return None, None, False
 
@@ -210,9 +276,6 @@ def is_url(text: str) -> bool:
     Returns:
         True if text is a valid URL with protocol
     """
-    url_pattern = compile(
-        r'^(https?|ftp|ftps|ws|wss|file)://'  # Protocol
-        r'[^\s]+$',  # Rest of URL (no whitespace)
-        IGNORECASE
-    )
-    return bool(url_pattern.match(text.strip()))
+    if '://' not in text:
+        return False
+    return bool(_URL_PATTERN.match(text.strip()))